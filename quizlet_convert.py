@@ -5,75 +5,110 @@ Convert Quizlet-exported TAB-separated files (.csv) to standards-compliant two-c
 Supports:
 • Single file or directory of files
 • Tabs → single comma between Term and Definition
-• Internal commas/quotes → fields wrapped in quotes and quotes doubled
+• Internal commas/quotes → only those fields wrapped in quotes, quotes doubled
 • Safe overwrite using a temp file
 """
 
 import os
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+# a process pool costs more to start than it saves unless a folder has both many
+# files and a lot of input; flashcard folders are far smaller and convert serially
+PARALLEL_MIN_FILES = 32
+PARALLEL_MIN_BYTES = 16 << 20  # 16 MiB
+
+def use_pool(entries: list[os.DirEntry]) -> bool:
+    """True if converting these scandir entries in a process pool is worth it."""
+    # count first, so ordinary folders never pay for a stat per file
+    return (len(entries) >= PARALLEL_MIN_FILES
+            and sum(e.stat().st_size for e in entries) >= PARALLEL_MIN_BYTES)
+
+# read/write buffer size; flashcard files are small, so keep it modest
+IO_BUF = 1 << 17  # 128 KiB
 
 def quote_field(text: str) -> str:
     text = text.strip()
     # if already quoted, strip outer quotes first
     if len(text) >= 2 and text[0] == text[-1] == '"':
         text = text[1:-1]
-    text = text.replace('"', '""')
-    return f'"{text}"'
+    # most fields need no quoting; a definition keeps any further tabs, which
+    # are quoted too so a re-read can't take them for the separator
+    if '"' in text:
+        text = text.replace('"', '""')
+        return f'"{text}"'
+    if "," in text or "\t" in text:
+        return f'"{text}"'
+    return text
 
-def convert_file(path: str) -> None:
+def convert_one(path: str) -> str:
+    """Convert one file in place; return its status line."""
     filename = os.path.basename(path)
 
-    if not path.lower().endswith(".csv"):
-        print(f"✖ Skipping non‑CSV file: {filename}")
-        return
+    if path[-4:].lower() != ".csv":
+        return f"✖ Skipping non‑CSV file: {filename}"
+
+    lines = []
+    append = lines.append
+    try:
+        with open(path, "r", encoding="utf-8", newline="", buffering=IO_BUF) as r:
+            for raw in r:
+                term, sep, definition = raw.rstrip("\r\n").partition("\t")
+                if not sep:
+                    continue
+                append(f"{quote_field(term)},{quote_field(definition)}\n")
+    except Exception as e:
+        return f"✖ Failed {filename}: {e}"
+
+    if not lines:
+        # nothing to convert (e.g. already converted), so don't write anything
+        return f"⚠ No valid records in {filename}, left unchanged"
 
     folder = os.path.dirname(path) or "."
     fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
     os.close(fd)
 
     try:
-        with open(path, "r", encoding="utf-8", newline="") as r, \
-             open(tmp,  "w", encoding="utf-8", newline="") as w:
-            lines_written = 0
-            for raw in r:
-                raw = raw.rstrip("\r\n")
-                if not raw:
-                    continue
-                parts = raw.split("\t")
-                if len(parts) < 2:
-                    continue
-                term = parts[0]
-                definition = "\t".join(parts[1:])
-                w.write(f"{quote_field(term)},{quote_field(definition)}\n")
-                lines_written += 1
+        # encode once, rather than per write
+        with open(tmp, "wb", buffering=IO_BUF) as w:
+            w.write("".join(lines).encode("utf-8"))
+        lines_written = len(lines)
 
-        if lines_written == 0:
-            # nothing to convert
-            os.remove(tmp)
-            print(f"⚠ No valid records in {filename}, left unchanged")
-        else:
-            os.replace(tmp, path)
-            print(f"✔ Overwrote {filename} ({lines_written} line{'s' if lines_written!=1 else ''})")
+        os.replace(tmp, path)
+        return f"✔ Overwrote {filename} ({lines_written} line{'s' if lines_written!=1 else ''})"
 
     except Exception as e:
         if os.path.exists(tmp):
             os.remove(tmp)
-        print(f"✖ Failed {filename}: {e}")
+        return f"✖ Failed {filename}: {e}"
+
+def convert_file(path: str) -> None:
+    print(convert_one(path))
 
 def convert_folder(folder: str) -> None:
     if not os.path.isdir(folder):
         print(f'✖ "{folder}" is not a directory')
         return
 
-    csvs = [f for f in os.listdir(folder) if f.lower().endswith(".csv")]
-    if not csvs:
+    with os.scandir(folder) as it:
+        entries = sorted((e for e in it if e.is_file() and e.name[-4:].lower() == ".csv"),
+                         key=lambda e: e.name)
+    paths = [e.path for e in entries]
+    if not paths:
         print(f"⚠ No .csv files found in directory: {folder}")
         return
 
-    print(f"→ Scanning {len(csvs)} file{'s' if len(csvs)!=1 else ''} in directory: {folder}")
-    for fname in csvs:
-        convert_file(os.path.join(folder, fname))
+    print(f"→ Scanning {len(paths)} file{'s' if len(paths)!=1 else ''} in directory: {folder}")
+    if not use_pool(entries):
+        results = map(convert_one, paths)
+    else:
+        # each file has its own temp file and atomic replace, so they're independent
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(convert_one, paths))
+    # print from here so progress comes out in file order either way
+    for line in results:
+        print(line)
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
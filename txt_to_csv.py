@@ -5,7 +5,7 @@ txt2csv_flashcards.py
 Convert all .txt files in a folder into CSV files for flashcards.
 - Each non-empty line is one card.
 - The first '=' on the line splits TERM (=) DEFINITION.
-- Fields are always quoted so commas are safe.
+- Fields containing commas, quotes or line breaks are quoted; others are written bare.
 - Output is one CSV per input by default (same basename).
 - Optionally combine all .txt files into a single CSV.
 
@@ -18,76 +18,110 @@ Usage:
 from __future__ import annotations
 import argparse
 import csv
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator
+
+# a process pool costs more to start than it saves unless a folder has both many
+# files and a lot of input; flashcard folders are far smaller and convert serially
+PARALLEL_MIN_FILES = 32
+PARALLEL_MIN_BYTES = 16 << 20  # 16 MiB
+
+def use_pool(entries: list[os.DirEntry]) -> bool:
+    """True if converting these scandir entries in a process pool is worth it."""
+    # count first, so ordinary folders never pay for a stat per file
+    return (len(entries) >= PARALLEL_MIN_FILES
+            and sum(e.stat().st_size for e in entries) >= PARALLEL_MIN_BYTES)
+
+# read/write buffer size; flashcard files are small, so keep it modest
+IO_BUF = 1 << 17  # 128 KiB
 
 def parse_line(line: str) -> tuple[str, str] | None:
     """Split at the first '='; return (term, definition) or None if invalid/blank."""
-    s = line.strip()
-    if not s:
+    # Split on first '=' only; a blank line has no '=' either. Stripping each
+    # half is enough, the whole line never needs a separate pass.
+    term, sep, definition = line.partition("=")
+    if not sep:
         return None
-    # Split on first '=' only
-    parts = s.split("=", 1)
-    if len(parts) != 2:
-        return None
-    term, definition = parts[0].strip(), parts[1].strip()
-    return term, definition
+    return term.strip(), definition.strip()
+
+def iter_cards(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yield (term, definition) for every valid line, skipping blanks and lines without '='."""
+    for raw in lines:
+        parsed = parse_line(raw)
+        if parsed is not None:
+            yield parsed
 
 def read_text(path: Path) -> list[tuple[str, str]]:
     """Read a .txt file (UTF-8/UTF-8-BOM; fallback cp949) and parse cards."""
-    encodings = ["utf-8-sig", "utf-8", "cp949"]  # cp949 is a common Korean encoding
+    with path.open("rb", buffering=IO_BUF) as f:
+        data = f.read()
+    # Read once, decode in memory. utf-8-sig also accepts UTF-8 without a BOM.
+    encodings = ["utf-8-sig", "cp949"]  # cp949 is a common Korean encoding
     last_err = None
     for enc in encodings:
         try:
-            with path.open("r", encoding=enc, errors="strict") as f:
-                lines = f.readlines()
+            text = data.decode(enc)
             break
-        except Exception as e:
+        except UnicodeDecodeError as e:
             last_err = e
     else:
         raise RuntimeError(f"Failed to read {path} with tried encodings {encodings}: {last_err}")
+    # universal newlines like text-mode readlines(); str.splitlines would also
+    # break on \x0c, \x1c-\x1e, \x85, \u2028 etc. inside a card
+    return list(iter_cards(io.StringIO(text, newline=None)))
 
-    cards: list[tuple[str, str]] = []
-    for idx, raw in enumerate(lines, 1):
-        parsed = parse_line(raw)
-        if parsed is None:
-            # Skip silently if the line is blank or lacks '='
-            continue
-        cards.append(parsed)
-    return cards
-
-def write_csv(rows: list[tuple[str, str]], out_path: Path):
+def write_csv(rows: Iterable[tuple[str, str]], out_path: Path):
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+    with out_path.open("w", encoding="utf-8", newline="", buffering=IO_BUF) as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
         # No header by default to avoid creating a dummy card in some flashcard apps
-        for term, definition in rows:
-            writer.writerow([term, definition])
+        writer.writerows(rows)
+
+def convert_one(path: Path, outdir: Path | None) -> tuple[int, Path]:
+    """Convert a single .txt to its own CSV; return (card count, output path)."""
+    rows = read_text(path)
+    if outdir:
+        out_path = outdir / f"{path.stem}.csv"
+    else:
+        out_path = path.with_suffix(".csv")
+    write_csv(rows, out_path)
+    return len(rows), out_path
+
+def map_files(fn, paths: list[Path], parallel: bool) -> list:
+    """Apply fn to every path, across a process pool if parallel is set."""
+    if not parallel:
+        return [fn(p) for p in paths]
+    with ProcessPoolExecutor() as ex:
+        return list(ex.map(fn, paths))
 
 def convert_folder(folder: Path, outdir: Path | None, combined: Path | None):
-    txt_files = sorted(p for p in folder.glob("*.txt") if p.is_file())
+    # .txt in any case, regular files or links to them
+    with os.scandir(folder) as it:
+        entries = sorted((e for e in it if e.name.lower().endswith(".txt") and e.is_file()),
+                         key=lambda e: e.name)
+    txt_files = [Path(e.path) for e in entries]
+    parallel = use_pool(entries)
     if not txt_files:
         print(f"No .txt files found in: {folder}")
         return
 
     if combined:
-        all_rows: list[tuple[str, str]] = []
-        for p in txt_files:
-            rows = read_text(p)
-            all_rows.extend(rows)
+        per_file = map_files(read_text, txt_files, parallel)
+        for p, rows in zip(txt_files, per_file):
             print(f"Read {len(rows):4d} cards from {p.name}")
-        write_csv(all_rows, combined)
-        print(f"\nWrote {len(all_rows)} cards to: {combined}")
+        # stream every file's cards into the writer rather than copying them into one list
+        write_csv(chain.from_iterable(per_file), combined)
+        print(f"\nWrote {sum(map(len, per_file))} cards to: {combined}")
         return
 
     # one CSV per .txt
-    for p in txt_files:
-        rows = read_text(p)
-        if outdir:
-            out_path = outdir / f"{p.stem}.csv"
-        else:
-            out_path = p.with_suffix(".csv")
-        write_csv(rows, out_path)
-        print(f"Wrote {len(rows):4d} cards -> {out_path}")
+    for count, out_path in map_files(partial(convert_one, outdir=outdir), txt_files, parallel):
+        print(f"Wrote {count:4d} cards -> {out_path}")
 
 def main():
     ap = argparse.ArgumentParser(description="Convert .txt flashcards to CSV.")